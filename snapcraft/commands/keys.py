@@ -30,7 +30,6 @@ from typing import TYPE_CHECKING, Any, cast
 import craft_store
 from craft_application.commands import AppCommand
 from craft_cli import emit
-from tabulate import tabulate
 from typing_extensions import override
 
 from snapcraft import errors, store, utils
@@ -58,22 +57,34 @@ class StoreKeysCommand(AppCommand):
         keys = list(_get_usable_keys())
         client = store.StoreClientCLI()
         account_info = client.get_account_info()
-        enabled_keys = [
+        enabled_keys = {
             account_key["public-key-sha3-384"]
             for account_key in account_info["account_keys"]
-        ]
+        }
+
+        # One pass over the keys collects the local fingerprints and the
+        # table rows together.
+        local_hashes = set()
+        table_rows = []
+        for key in keys:
+            sha3_384 = key["sha3-384"]
+            local_hashes.add(sha3_384)
+            registered = sha3_384 in enabled_keys
+            table_rows.append(
+                (
+                    "*" if registered else "-",
+                    key["name"],
+                    sha3_384,
+                    "" if registered else "(not registered)",
+                )
+            )
 
         if keys:
+            # deferred so CLI startup doesn't pay for the formatter
+            from tabulate import tabulate  # noqa: PLC0415 (import-outside-top-level)
+
             tabulated_keys = tabulate(
-                [
-                    (
-                        "*" if key["sha3-384"] in enabled_keys else "-",
-                        key["name"],
-                        key["sha3-384"],
-                        "" if key["sha3-384"] in enabled_keys else "(not registered)",
-                    )
-                    for key in keys
-                ],
+                table_rows,
                 headers=["", "Name", "SHA3-384 fingerprint", ""],
                 tablefmt="plain",
             )
@@ -86,11 +97,9 @@ class StoreKeysCommand(AppCommand):
             )
 
         if enabled_keys:
-            local_hashes = {key["sha3-384"] for key in keys}
-            registered_keys = "\n".join(
-                f"- {key}" for key in enabled_keys if key not in local_hashes
-            )
-            if registered_keys:
+            missing_keys = enabled_keys - local_hashes
+            if missing_keys:
+                registered_keys = "\n".join(f"- {key}" for key in sorted(missing_keys))
                 emit.message(
                     "The following SHA3-384 key fingerprints have been registered "
                     f"but are not available on this system:\n{registered_keys}"
@@ -160,6 +169,8 @@ class StoreCreateKeyCommand(AppCommand):
         if parsed_args.key_name in enabled_names:
             raise store.errors.KeyAlreadyRegisteredError(parsed_args.key_name)
         subprocess.check_call(["snap", "create-key", parsed_args.key_name])
+        # The cached listing doesn't include the new key.
+        _load_keys.cache_clear()
 
 
 class StoreRegisterKeyCommand(AppCommand):
@@ -225,25 +236,27 @@ class StoreRegisterKeyCommand(AppCommand):
         emit.progress("Registering key ...")
         account_info = client.get_account_info()
         account_key_request = self._export_key(key["name"], account_info["account_id"])
-        client.register_key(account_key_request)
+        client.register_key(account_key_request.decode())
         emit.message(
             f"Done. The key {key['name']!r} ({key['sha3-384']!r}) may be used to sign your assertions."
         )
 
     @staticmethod
-    def _export_key(name: str, account_id: str) -> str:
+    def _export_key(name: str, account_id: str) -> bytes:
         """Export a snapd key as an assertion.
 
+        The output is returned as raw bytes; it is only decoded once, at the
+        store boundary.
+
         :param name: The local key name to export.
         :param account_id: The account ID for the key.
 
-        :returns: The serialized key assertion string.
+        :returns: The serialized key assertion.
 
         :raises subprocess.CalledProcessError: If the snap command fails.
         """
         return subprocess.check_output(
-            ["snap", "export-key", f"--account={account_id}", name],
-            universal_newlines=True,
+            ["snap", "export-key", f"--account={account_id}", name]
         )
 
 
@@ -285,12 +298,14 @@ class StoreSignBuildCommand(AppCommand):
         store_client = store.StoreClientCLI()
         account_info = store_client.get_account_info()
 
-        try:
-            authority_id = account_info["id"]
-            snap_id = account_info["snaps"][store.constants.DEFAULT_SERIES][snap_name][
-                "snap-id"
-            ]
-        except KeyError:
+        authority_id = account_info.get("id")
+        snap_entry = (
+            account_info.get("snaps", {})
+            .get(store.constants.DEFAULT_SERIES, {})
+            .get(snap_name, {})
+        )
+        snap_id = snap_entry.get("snap-id")
+        if authority_id is None or snap_id is None:
             raise StoreBuildAssertionPermissionError(
                 snap_name, store.constants.DEFAULT_SERIES
             )
@@ -375,6 +390,8 @@ def _select_key(keys: list[dict[str, Any]]) -> dict[str, Any]:
     :returns: The selected key.
     """
     if len(keys) > 1:
+        from tabulate import tabulate  # noqa: PLC0415 (import-outside-top-level)
+
         emit.progress("Select a key:\n", permanent=True)
         tabulated_keys = tabulate(
             [(i + 1, key["name"], key["sha3-384"]) for i, key in enumerate(keys)],
@@ -393,6 +410,24 @@ def _select_key(keys: list[dict[str, Any]]) -> dict[str, Any]:
         return keys[0]
 
 
+@functools.lru_cache(maxsize=1)
+def _load_keys() -> list[dict[str, Any]]:
+    """Load all keys registered by snapd.
+
+    Memoized: listing keys shells out to snapd, and a single command may need
+    the listing more than once. The cache is cleared after ``snap create-key``
+    so the new key shows up.
+
+    :returns: A list of dicts representing snap keys.
+
+    :raises subprocess.CalledProcessError: If the snap command fails.
+    :raises FileNotFoundError: If the snap executable isn't found.
+    :raises json.JSONDecodeError: If snapd returns invalid JSON.
+    """
+    keys = json.loads(subprocess.check_output(["snap", "keys", "--json"]))
+    return keys if keys is not None else []
+
+
 def _get_usable_keys(name: str | None = None) -> Iterator[dict[str, Any]]:
     """Get keys registered by snapd.
 
@@ -406,10 +441,6 @@ def _get_usable_keys(name: str | None = None) -> Iterator[dict[str, Any]]:
     :raises KeyError: On invalid snapd output.
     :raises TypeError: On invalid snapd output.
     """
-    keys = json.loads(
-        subprocess.check_output(["snap", "keys", "--json"], universal_newlines=True)
-    )
-    if keys is not None:
-        for key in keys:
-            if name is None or name == key["name"]:
-                yield key
+    for key in _load_keys():
+        if name is None or name == key["name"]:
+            yield key
@@ -25,7 +25,6 @@ from typing import TYPE_CHECKING, cast
 from craft_application.commands import AppCommand
 from craft_cli import emit
 from craft_cli.errors import ArgumentParsingError
-from tabulate import tabulate
 from typing_extensions import override
 
 from snapcraft import store, utils
@@ -188,6 +187,9 @@ class StorePromoteCommand(AppCommand):
         )
         from_channel_set = snap_status.get_channel_set(from_channel)
 
+        # deferred so CLI startup doesn't pay for the formatter
+        from tabulate import tabulate  # noqa: PLC0415 (import-outside-top-level)
+
         emit.progress(f"Build set information for {from_channel!r}", permanent=True)
         emit.progress(
             tabulate(
@@ -24,7 +24,6 @@ from typing import TYPE_CHECKING
 from craft_application.commands import AppCommand
 from craft_cli import emit
 from packaging import version
-from tabulate import tabulate
 from typing_extensions import override
 
 from snapcraft import store
@@ -120,6 +119,9 @@ class StoreMetricsCommand(AppCommand):
             output = json.dumps(metric_results.marshal(), indent=2, sort_keys=True)
             emit.message(output)
         elif parsed_args.format == "table":
+            # deferred so CLI startup doesn't pay for the formatter
+            from tabulate import tabulate  # noqa: PLC0415 (import-outside-top-level)
+
             rows = self.convert_metrics_to_table(metric_results, transpose=True)
             output = tabulate(rows, tablefmt="plain")
             if output:
@@ -25,7 +25,6 @@ from typing import TYPE_CHECKING
 
 from craft_application.commands import AppCommand
 from craft_cli import emit
-from tabulate import tabulate
 from typing_extensions import override
 
 from snapcraft import errors, store, utils
@@ -165,6 +164,11 @@ class StoreNamesCommand(AppCommand):
             headers = ["Name", "Since", "Visibility", "Notes"]
 
             if parsed_args.format == "table":
+                # deferred so CLI startup doesn't pay for the formatter
+                from tabulate import (  # noqa: PLC0415 (import-outside-top-level)
+                    tabulate,
+                )
+
                 tabulated_snaps = tabulate(
                     snaps,
                     headers=headers,
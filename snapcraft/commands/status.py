@@ -27,7 +27,6 @@ from typing import TYPE_CHECKING, Final, cast
 
 from craft_application.commands import AppCommand
 from craft_cli import emit
-from tabulate import tabulate
 from typing_extensions import override
 
 from snapcraft import errors, store
@@ -146,8 +145,7 @@ def _get_channel_order(
         snap_channels = [s for s in snap_channels if s.track in tracks]
 
     for snap_channel in snap_channels:
-        if snap_channel.track not in channel_order:
-            channel_order[snap_channel.track] = []
+        channel_order.setdefault(snap_channel.track, [])
         if snap_channel.fallback is None:
             channel_order[snap_channel.track].append(snap_channel.name)
         else:
@@ -326,6 +324,9 @@ def get_tabulated_channel_map(  # noqa: C901 (complex-structure)
     repeat: bool,
 ):
     """Return a tabulated channel map."""
+    # deferred so CLI startup doesn't pay for the formatter
+    from tabulate import tabulate  # noqa: PLC0415 (import-outside-top-level)
+
     channel_order = _get_channel_order(snap_channel_map.snap.channels, tracks)
 
     channel_lines = []
@@ -355,8 +356,10 @@ def get_tabulated_channel_map(  # noqa: C901 (complex-structure)
                     snap_channel_map, channel_name, architecture, next_tick
                 )
                 for channel_line in parsed_channels:
+                    # unpack in place rather than concatenating, which would
+                    # allocate a throwaway list per row
                     channel_lines.append(
-                        [track_string, architecture_string] + channel_line
+                        [track_string, architecture_string, *channel_line]
                     )
                     track_string = ""
                     architecture_string = ""
@@ -366,9 +369,9 @@ def get_tabulated_channel_map(  # noqa: C901 (complex-structure)
 
     if any(line[expires_column] != "" for line in channel_lines):
         headers.append("Expires at")
-        for index, _ in enumerate(channel_lines):
-            if not channel_lines[index][expires_column]:
-                channel_lines[index][expires_column] = "-"
+        for line in channel_lines:
+            if not line[expires_column]:
+                line[expires_column] = "-"
     else:
         headers.append("")
 
@@ -412,6 +415,8 @@ class StoreTracksCommand(AppCommand):
 
     @override
     def run(self, parsed_args: argparse.Namespace) -> None:
+        from tabulate import tabulate  # noqa: PLC0415 (import-outside-top-level)
+
         snap_channel_map = store.StoreClientCLI().get_channel_map(
             snap_name=parsed_args.name
         )
@@ -476,6 +481,8 @@ class StoreRevisionsCommand(AppCommand):
 
     @override
     def run(self, parsed_args: argparse.Namespace):
+        from tabulate import tabulate  # noqa: PLC0415 (import-outside-top-level)
+
         releases = store.StoreClientCLI().list_releases(snap_name=parsed_args.snap_name)
 
         parsed_revisions: list[tuple[str, ...]] = []
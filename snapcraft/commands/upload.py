@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 import contextlib
+import io
 import os
 import pathlib
 import textwrap
@@ -39,6 +40,14 @@ if TYPE_CHECKING:
     from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
 
 
+class _SnapIcon(io.BytesIO):
+    """Icon data read out of a snap, carrying the filename the Store expects."""
+
+    def __init__(self, data: bytes, name: str) -> None:
+        super().__init__(data)
+        self.name = name
+
+
 class ComponentOption:
     """Argparse helper to validate and convert a 'component' option.
 
@@ -316,18 +325,15 @@ class StoreUploadMetadataCommand(AppCommand):
     @contextlib.contextmanager
     def _get_icon_from_snap_file(self, snap_path: pathlib.Path):
         icon_file = None
-        with utils.unsquash_snap(
-            snap_path, ["--extract-file", "meta/gui"]
-        ) as unsquashed_snap:
-            emit.debug(f"Output extracting icon from snap {unsquashed_snap}")
-            for extension in ("png", "svg"):
-                icon_name = f"icon.{extension}"
-                icon_path = (unsquashed_snap / f"meta/gui/{icon_name}").resolve()
-                if icon_path.is_file():
-                    icon_file = open(icon_path, "rb")
-                    break
-            try:
-                yield icon_file
-            finally:
-                if icon_file is not None:
-                    icon_file.close()
+        for extension in ("png", "svg"):
+            icon_name = f"meta/gui/icon.{extension}"
+            icon_bytes = utils.get_file_from_snap_file(snap_path, icon_name)
+            if icon_bytes is not None:
+                emit.debug(f"Found {icon_name!r} in snap {snap_path.name!r}")
+                icon_file = _SnapIcon(icon_bytes, icon_name)
+                break
+        try:
+            yield icon_file
+        finally:
+            if icon_file is not None:
+                icon_file.close()
@@ -41,6 +41,11 @@ _GNU_VERSION_D = ".gnu.version_d"
 _GNU_VERSION_R = ".gnu.version_r"
 _INTERP = ".interp"
 
+# Compiled once: _parse_ldd_output probes these per output line, for every
+# ELF file inspected.
+_LDD_FOUND_RE = re.compile(r"\t(.*) => (.*) \(0x")
+_LDD_UNRESOLVED_RE = re.compile(r"\t(.*) => (.*)")
+
 
 class _NeededLibrary:
     """Represents an ELF library version."""
@@ -478,11 +483,11 @@ def _parse_ldd_output(output: str) -> dict[str, str]:
 
     for line in ldd_lines:
         # First match against libraries that are found.
-        match = re.match(r"\t(.*) => (.*) \(0x", line)
+        match = _LDD_FOUND_RE.match(line)
 
         if not match:
             # Now find those not found, or not providing the address...
-            match = re.match(r"\t(.*) => (.*)", line)
+            match = _LDD_UNRESOLVED_RE.match(line)
 
         # Ignore ld-linux, linux-vdso, etc. that don't match these regex.
         # As Ubuntu 16.04's ldd provides an empty string for the found
@@ -522,6 +527,4 @@ def _check_output(cmd: list[str], *, extra_env: dict[str, str]) -> str:
     debug_cmd += cmd
 
     emit.debug(f"executing: {' '.join(debug_cmd)}")
-    output = subprocess.check_output(cmd, env=env).decode()
-
-    return output
+    return subprocess.check_output(cmd, env=env, text=True, encoding="utf-8")
@@ -132,9 +132,11 @@ class Patcher:
     def get_current_rpath(self, elf_file: ElfFile) -> list[str]:
         """Obtain the current rpath from the ELF file dynamic section."""
         output = subprocess.check_output(
-            [self._patchelf_cmd, "--print-rpath", str(elf_file.path)]
+            [self._patchelf_cmd, "--print-rpath", str(elf_file.path)],
+            text=True,
+            encoding="utf-8",
         )
-        return [x for x in output.decode().strip().split(":") if x]
+        return [x for x in output.strip().split(":") if x]
 
     @functools.lru_cache(maxsize=1024)  # noqa: B019 Possible memory leaks in lru_cache
     def get_proposed_rpath(self, elf_file: ElfFile) -> list[str]:
@@ -16,6 +16,7 @@
 
 """Helpers to parse and handle ELF binary files."""
 
+import os
 from pathlib import Path
 
 from snapcraft import errors
@@ -24,25 +25,38 @@ from snapcraft import errors
 class PatcherError(errors.SnapcraftError):
     """Failed to patch an ELF file."""
 
+    __slots__ = ("path", "cmd", "code")
+
     def __init__(self, path: Path, *, cmd: list[str], code: int) -> None:
         self.path = path
         self.cmd = cmd
         self.code = code
 
-        super().__init__(f"Error patching ELF file: {cmd} failed with exit code {code}")
+        super().__init__("Error patching ELF file")
+
+    def __str__(self) -> str:
+        # formatted on demand: repr of a long patchelf argv is wasted work
+        # when the error is caught and wrapped without being displayed
+        return f"Error patching ELF file: {self.cmd} failed with exit code {self.code}"
 
 
 class CorruptedElfFile(errors.SnapcraftError):
     """Not a valid ELF file."""
 
+    __slots__ = ("path",)
+
     def __init__(self, path: Path, error: Exception) -> None:
         self.path = path
 
-        super().__init__(f"Error parsing ELF file {str(path)!r}: {str(error)}")
+        fspath = os.fspath(path)
+        super().__init__(f"Error parsing ELF file {fspath!r}: {error!s}")
 
 
 class DynamicLinkerNotFound(errors.SnapcraftError):
     """Failed to find the dynamic linker for this platform."""
 
+    __slots__ = ()
+
     def __init__(self, path: Path) -> None:
-        super().__init__(f"Dynamic linker {str(path)!r} not found.")
+        fspath = os.fspath(path)
+        super().__init__(f"Dynamic linker {fspath!r} not found.")
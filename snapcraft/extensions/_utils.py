@@ -19,6 +19,7 @@
 import collections
 import contextlib
 import copy
+import json
 from typing import TYPE_CHECKING, Any
 
 from .registry import get_extension_class
@@ -27,6 +28,37 @@ if TYPE_CHECKING:
     from .extension import Extension
 
 
+def _has_non_str_keys(data: Any) -> bool:
+    """Check for mapping keys the JSON round-trip would coerce to strings.
+
+    YAML happily produces them: bare ``on:``/``yes:``/``123:`` parse to bool
+    and int keys.
+    """
+    if isinstance(data, dict):
+        return any(
+            not isinstance(key, str) or _has_non_str_keys(value)
+            for key, value in data.items()
+        )
+    if isinstance(data, list):
+        return any(_has_non_str_keys(item) for item in data)
+    return False
+
+
+def _deep_copy_yaml_data(yaml_data: dict[str, Any]) -> dict[str, Any]:
+    """Deep-copy YAML data much faster than copy.deepcopy for plain data.
+
+    Falls back to copy.deepcopy when the data holds non-JSON types, such as
+    datetimes from YAML timestamps, or non-string mapping keys that the JSON
+    round-trip would silently turn into strings.
+    """
+    if _has_non_str_keys(yaml_data):
+        return copy.deepcopy(yaml_data)
+    try:
+        return json.loads(json.dumps(yaml_data))
+    except (TypeError, ValueError):
+        return copy.deepcopy(yaml_data)
+
+
 def apply_extensions(yaml_data: dict[str, Any], *, arch: str, target_arch: str) -> None:
     """Apply all extensions in place.
 
@@ -61,7 +93,9 @@ def apply_extensions(yaml_data: dict[str, Any], *, arch: str, target_arch: str)
     for extension_name in sorted(declared_extensions.keys()):
         extension_class = get_extension_class(extension_name)
         extension = extension_class(
-            yaml_data=copy.deepcopy(yaml_data), arch=arch, target_arch=target_arch
+            yaml_data=_deep_copy_yaml_data(yaml_data),
+            arch=arch,
+            target_arch=target_arch,
         )
         extension.validate(extension_name=extension_name)
         _apply_extension(yaml_data, declared_extensions[extension_name], extension)
@@ -19,7 +19,7 @@
 import fnmatch
 from pathlib import Path
 
-from overrides import overrides
+from typing_extensions import override
 
 from snapcraft.elf import elf_utils
 
@@ -71,7 +71,7 @@ class GpuLinter(Linter):
     def get_categories() -> list[str]:
         return ["gpu"]
 
-    @overrides
+    @override
     def run(self) -> list[LinterIssue]:
         if self._snap_metadata.type not in ("app", None):
             return []
@@ -2274,6 +2274,14 @@ class Project(models.Project):
         """
         return _get_partitions_from_components(self.components)
 
+    @override
+    def to_yaml_string(self) -> str:
+        """Return this model as a YAML string."""
+        # Deferred import because yaml_utils imports from snapcraft.models
+        from snapcraft.parts.yaml_utils import dump_yaml  # noqa: PLC0415
+
+        return cast(str, dump_yaml(self.marshal()))
+
 
 def _custom_error(error_msg: str):
     def _validator(v: Any, next_: Any, ctx: pydantic.ValidationInfo):
@@ -16,10 +16,14 @@
 
 """Snap file packing."""
 
+import os
+import stat
 import subprocess
+import threading
 from collections.abc import Callable
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
+from typing import TextIO, cast
 
 from craft_cli import emit
 
@@ -29,9 +33,11 @@ from snapcraft import errors
 def _verify_snap(directory: Path) -> None:
     emit.debug("pack_snap: check skeleton")
     try:
+        # stdout is empty on success; only stderr is worth capturing
         subprocess.run(
             ["snap", "pack", "--check-skeleton", directory],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             check=True,
             text=True,
         )
@@ -45,50 +51,53 @@ def _verify_snap(directory: Path) -> None:
         raise errors.SnapcraftError(msg, details=f"{err!s}") from err
 
 
-def _get_directory(output: str | None) -> Path:
-    """Get directory to output the snap file to.
+@lru_cache(maxsize=32)
+def _resolve_dir(path: str) -> Path:
+    """Resolve a directory path, memoized for repeated packs to the same place."""
+    return Path(path).resolve()
 
-    If no directory is provided, return current working directory.
 
-    :param output: Snap output file name or directory.
-
-    :return: The directory to output the snap file to.
-    """
-    if output:
-        output_path = Path(output)
-        if output_path.is_dir():
-            return output_path.resolve()
-        return output_path.parent.resolve()
-
-    return Path.cwd()
-
-
-def _get_filename(
+def _resolve_output(
     output: str | None,
     name: str | None = None,
     version: str | None = None,
     target: str | None = None,
-) -> str | None:
-    """Get output filename of the snap file.
+) -> tuple[Path, str | None]:
+    """Get the directory and filename to output the snap file to.
 
-    If `output` is not a file, then the filename will be <name>_<version>_<target_arch>.snap
+    If no directory is provided, use the current working directory. If `output`
+    is not a file, then the filename will be <name>_<version>_<target_arch>.snap
 
-    :param output: Snap file name or directory.
+    :param output: Snap output file name or directory.
     :param name: Name of snap project.
     :param version: Version of snap project.
     :param target: Target platform or architecture of the snap.
 
-    :return: The filename of the snap file if output or name/version/target_arch are specified.
+    :return: A tuple of the output directory and the snap filename, if output
+    or name/version/target_arch are specified.
     """
+    output_file: str | None = None
+
     if output:
+        # a single stat() call answers the directory check for both results
         output_path = Path(output)
-        if not output_path.is_dir():
-            return output_path.name
+        try:
+            is_dir = stat.S_ISDIR(output_path.stat().st_mode)
+        except OSError:
+            is_dir = False
 
-    if all(i is not None for i in [name, version, target]):
-        return f"{name}_{version}_{target}.snap"
+        if is_dir:
+            output_dir = _resolve_dir(os.fspath(output_path))
+        else:
+            output_dir = _resolve_dir(os.fspath(output_path.parent))
+            output_file = output_path.name
+    else:
+        output_dir = Path.cwd()
+
+    if output_file is None and all(i is not None for i in [name, version, target]):
+        output_file = f"{name}_{version}_{target}.snap"
 
-    return None
+    return output_dir, output_file
 
 
 def _pack(
@@ -108,21 +117,49 @@ def _pack(
 
     :raises SnapcraftError: If the directory cannot be packed.
     """
-    command: list[str | Path] = ["snap", "pack"]
+    command: list[str] = ["snap", "pack"]
 
     if output_file:
         command.extend(["--filename", output_file])
     if compression:
         command.extend(["--compression", compression])
-    command.extend([directory, output_dir])
+    command.extend([os.fspath(directory), os.fspath(output_dir)])
 
     emit.debug(f"Pack command: {command}")
-    try:
-        proc = subprocess.run(command, capture_output=True, check=True, text=True)
-    except subprocess.CalledProcessError as err:
-        raise errors.SnapPackError(err) from err
 
-    return Path(str(proc.stdout).partition(":")[2].strip()).name
+    last_line = ""
+    with (
+        emit.open_stream("Packing...") as stream,
+        subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        ) as proc,
+    ):
+        # drain stderr on a thread so a chatty child can't fill the pipe and
+        # deadlock against the stdout loop below
+        stderr_chunks: list[str] = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(cast(TextIO, proc.stderr).read())
+        )
+        stderr_reader.start()
+
+        # forward progress to the emitter instead of buffering it all; only
+        # the last line is needed to learn the artifact's filename
+        for line in cast(TextIO, proc.stdout):
+            os.write(stream, line.encode())
+            if line.strip():
+                last_line = line
+        stderr_reader.join()
+        stderr = "".join(stderr_chunks)
+
+    if proc.returncode:
+        err = subprocess.CalledProcessError(proc.returncode, command, stderr=stderr)
+        raise errors.SnapPackError(err)
+
+    return last_line.partition(":")[2].strip().rsplit("/", 1)[-1]
 
 
 def _retry_with_newer_snapd(func: Callable) -> Callable:
@@ -132,7 +169,7 @@ def _retry_with_newer_snapd(func: Callable) -> Callable:
     ) -> str:
         try:
             return func(directory, output_dir, compression)
-        except errors.SnapcraftError:
+        except errors.SnapPackError:
             try:
                 with emit.open_stream(
                     "Refreshing snapd to support components"
@@ -222,16 +259,18 @@ def pack_snap(
     """
     emit.debug(f"pack_snap: output={output!r}, compression={compression!r}")
 
-    # TODO remove workaround once LP: #1950465 is fixed
-    _verify_snap(directory)
-
-    output_dir = _get_directory(output)
-    output_file = _get_filename(output, name, version, target)
+    output_dir, output_file = _resolve_output(output, name, version, target)
 
     emit.progress("Creating snap package...")
-    return _pack(
-        directory=directory,
-        output_dir=output_dir,
-        output_file=output_file,
-        compression=compression,
-    )
+    try:
+        return _pack(
+            directory=directory,
+            output_dir=output_dir,
+            output_file=output_file,
+            compression=compression,
+        )
+    except errors.SnapPackError:
+        # Re-run the skeleton check for a friendlier error message. Raises
+        # SnapcraftError if the snap metadata is invalid.
+        _verify_snap(directory)
+        raise
@@ -106,16 +106,14 @@ class ColconPlugin(_ros.RosPlugin):
         return env
 
     def _get_source_command(self, path: str) -> list[str]:
+        ros_wspath = f"{path}/opt/ros/${{ROS_DISTRO}}"
+        snap_wspath = f"{path}/opt/ros/snap"
         return [
-            f'if [ -f "{path}/opt/ros/${{ROS_DISTRO}}/local_setup.sh" ]; then',
-            'AMENT_CURRENT_PREFIX="{wspath}" . "{wspath}/local_setup.sh"'.format(
-                wspath=f"{path}/opt/ros/${{ROS_DISTRO}}"
-            ),
+            f'if [ -f "{ros_wspath}/local_setup.sh" ]; then',
+            f'AMENT_CURRENT_PREFIX="{ros_wspath}" . "{ros_wspath}/local_setup.sh"',
             "fi",
-            f'if [ -f "{path}/opt/ros/snap/local_setup.sh" ]; then',
-            'COLCON_CURRENT_PREFIX="{wspath}" . "{wspath}/local_setup.sh"'.format(
-                wspath=f"{path}/opt/ros/snap"
-            ),
+            f'if [ -f "{snap_wspath}/local_setup.sh" ]; then',
+            f'COLCON_CURRENT_PREFIX="{snap_wspath}" . "{snap_wspath}/local_setup.sh"',
             "fi",
         ]
 
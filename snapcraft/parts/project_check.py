@@ -61,18 +61,16 @@ def _check_snap_dir(snap_dir_path: Path) -> None:
                 unexpected_paths.add(str(relpath))
 
     if unexpected_paths:
-        snap_dir_relpath = snap_dir_path.relative_to(Path())
+        snap_dir = str(snap_dir_path.relative_to(Path()))
+        snap_dir_local = str(snap_dir_path.relative_to(Path()) / "local")
+        unexpected_files = "\n- ".join(sorted(unexpected_paths))
         emit.progress(
-            "The {snap_dir!r} directory is meant specifically for snapcraft, but it contains\n"
+            f"The {snap_dir!r} directory is meant specifically for snapcraft, but it contains\n"
             "the following non-snapcraft-related paths:"
-            "\n- {unexpected_files}\n\n"
+            f"\n- {unexpected_files}\n\n"
             "This is unsupported and may cause unexpected behavior. If you must store\n"
-            "these files within the {snap_dir!r} directory, move them to {snap_dir_local!r}\n"
-            "which is ignored by snapcraft.".format(
-                snap_dir=str(snap_dir_relpath),
-                snap_dir_local=str(snap_dir_relpath / "local"),
-                unexpected_files="\n- ".join(sorted(unexpected_paths)),
-            ),
+            f"these files within the {snap_dir!r} directory, move them to {snap_dir_local!r}\n"
+            "which is ignored by snapcraft.",
             permanent=True,
         )
 
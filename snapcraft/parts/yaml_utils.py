@@ -27,6 +27,7 @@ import craft_cli
 import yaml
 import yaml.error
 from craft_parts import ProjectVar, ProjectVarInfo
+from craft_platforms import DebianArchitecture
 
 from snapcraft import const, errors, utils
 from snapcraft.extensions import apply_extensions
@@ -34,6 +35,15 @@ from snapcraft.models import GrammarAwareProject
 
 from . import grammar
 
+try:
+    # Use the fast libyaml-based loader and dumper when PyYAML was built
+    # against libyaml (yaml.__with_libyaml__).
+    from yaml import CSafeDumper as _YamlSafeDumper
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlSafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore[assignment]
+
 _CORE_PART_KEYS = ["build-packages", "build-snaps"]
 _CORE_PART_NAME = "snapcraft/core"
 
@@ -93,7 +103,7 @@ def _dict_constructor(
         ) from type_error
 
 
-class _SafeLoader(yaml.SafeLoader):
+class _SafeLoader(_YamlSafeLoader):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -102,6 +112,21 @@ class _SafeLoader(yaml.SafeLoader):
         )
 
 
+def _repr_str(dumper: yaml.Dumper, data: str) -> yaml.ScalarNode:
+    """Multi-line string representer for the YAML dumper."""
+    if "\n" in data:
+        return dumper.represent_scalar("tag:yaml.org,2002:str", data, style="|")
+    return dumper.represent_scalar("tag:yaml.org,2002:str", data)
+
+
+class _SafeDumper(_YamlSafeDumper):
+    pass
+
+
+_SafeDumper.add_representer(str, _repr_str)
+_SafeDumper.add_representer(DebianArchitecture, _repr_str)
+
+
 def safe_load(filestream: TextIO) -> dict[str, Any]:
     """Safe load and parse YAML-formatted file to a dictionary.
 
@@ -110,11 +135,28 @@ def safe_load(filestream: TextIO) -> dict[str, Any]:
     :raises SnapcraftError: if the file could not be loaded and parsed.
     """
     try:
-        return yaml.safe_load(filestream)
+        return yaml.load(filestream, Loader=_YamlSafeLoader)  # noqa: S506 loader is safe
     except yaml.error.YAMLError as err:
         raise errors.SnapcraftError(f"snapcraft.yaml parsing error: {err!s}") from err
 
 
+def dump_yaml(data: Any, stream: TextIO | None = None, **kwargs: Any) -> str | None:
+    """Dump a data structure to YAML using the fast dumper when available.
+
+    This works as a drop-in replacement for ``yaml.safe_dump``, but routes
+    through libyaml's C-based emitter when PyYAML was built against libyaml.
+
+    :param data: The data structure to dump.
+    :param stream: The optional text stream to which to write.
+    :param kwargs: Keyword arguments passed to pyyaml.
+
+    :returns: The YAML document as a string, or None if a stream was given.
+    """
+    kwargs.setdefault("sort_keys", False)
+    kwargs.setdefault("allow_unicode", True)
+    return cast(str | None, yaml.dump(data, stream, Dumper=_SafeDumper, **kwargs))
+
+
 def get_base(filestream: TextIO) -> str | None:
     """Get the effective base from a snapcraft.yaml file.
 
@@ -25,10 +25,9 @@ import os
 import pathlib
 import subprocess
 import tempfile
-from typing import Any, Generic, TypeVar
+from typing import IO, Any, Generic, TypeVar, cast
 
 import craft_cli
-import tabulate
 import yaml
 from craft_application.errors import CraftValidationError
 from craft_application.services import base
@@ -166,6 +165,9 @@ class Assertion(base.AppService, Generic[EditableAssertionT, AssertionT]):
                     }
                     craft_cli.emit.message(json.dumps(json_assertions, indent=4))
                 case const.OutputFormat.table:
+                    # deferred so CLI startup doesn't pay for the formatter
+                    import tabulate  # noqa: PLC0415 (import-outside-top-level)
+
                     tabulated_sets = tabulate.tabulate(
                         normalized_assertions,
                         headers=headers,
@@ -258,15 +260,31 @@ class Assertion(base.AppService, Generic[EditableAssertionT, AssertionT]):
         if key_name:
             cmdline += ["-k", key_name]
 
-        # snapd expects a json string where all scalars are strings
-        unsigned_assertion = json.dumps(assertion.marshal_scalars_as_strings())
-
         try:
             # pause the emitter for passphrase prompts
-            with craft_cli.emit.pause():
-                signed_assertion = subprocess.check_output(
-                    cmdline, input=unsigned_assertion.encode()
-                )
+            with (
+                craft_cli.emit.pause(),
+                subprocess.Popen(
+                    cmdline, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+                ) as snap_sign,
+            ):
+                # serialize straight into the pipe instead of building the
+                # json string and an encoded copy of it first: signing starts
+                # while stdin is still being written and peak memory stays at
+                # one copy of the assertion.
+                # snapd expects a json string where all scalars are strings
+                try:
+                    with io.TextIOWrapper(
+                        cast("IO[bytes]", snap_sign.stdin), encoding="utf-8"
+                    ) as stdin:
+                        json.dump(assertion.marshal_scalars_as_strings(), stdin)
+                except BrokenPipeError:
+                    # snap sign exited before draining stdin; fall through to
+                    # the returncode check for the real error
+                    pass
+                signed_assertion = cast("IO[bytes]", snap_sign.stdout).read()
+            if snap_sign.returncode:
+                raise subprocess.CalledProcessError(snap_sign.returncode, cmdline)
         except subprocess.CalledProcessError as sign_error:
             raise errors.SnapcraftAssertionError(
                 "Failed to sign assertion"
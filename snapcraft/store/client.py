@@ -16,6 +16,7 @@
 
 """Snapcraft Store Client with CLI hooks."""
 
+import functools
 import http
 import os
 import platform
@@ -42,6 +43,8 @@ from .errors import NoSnapIdError, SnapNotFoundError
 from .onprem_client import ON_PREM_ENDPOINTS, OnPremClient
 
 _POLL_DELAY = 1
+_ACCOUNT_INFO_TTL = 60
+"""How long cached account information stays fresh, in seconds."""
 _HUMAN_STATUS = {
     "being_processed": "processing",
     "ready_to_release": "ready to release!",
@@ -51,8 +54,16 @@ _HUMAN_STATUS = {
 }
 
 
+@functools.cache
 def build_user_agent(version: str = __version__):
-    """Build Snapcraft's user agent."""
+    """Build Snapcraft's user agent.
+
+    Memoized: the distro and host-architecture probes behind it cost file
+    and subprocess I/O, and the result never changes within a process. The
+    agent string is handed to craft-store's HTTP client, which sets it once
+    on a shared requests.Session reused (with keep-alive) for every store
+    request.
+    """
     dist_id = distro.id()
     dist_version = distro.version()
     dist_arch = DebianArchitecture.from_host().to_platform_arch()
@@ -175,6 +186,7 @@ class LegacyStoreClientCLI:
     def __init__(self, ephemeral: bool = False):
         self.store_client = get_client(ephemeral=ephemeral)
         self._base_url = get_store_url()
+        self._cached_account_info: tuple[float, dict[str, Any]] | None = None
 
     def login(
         self,
@@ -273,6 +285,8 @@ class LegacyStoreClientCLI:
         except craft_store.errors.CredentialsUnavailable:
             emit.message("You are required to login before continuing")
 
+        # the new login may be for a different account
+        self.invalidate_account_info()
         self.login()
         return self.store_client.request(*args, **kwargs)
 
@@ -302,6 +316,7 @@ class LegacyStoreClientCLI:
             self._base_url + "/dev/api/register-name/",
             json=data,
         )
+        self.invalidate_account_info()
 
     def register_key(self, account_key_request: str) -> None:
         """Register a key with the Snap Store.
@@ -313,6 +328,7 @@ class LegacyStoreClientCLI:
             self._base_url + "/dev/api/account/account-key",
             json={"account_key_request": account_key_request},
         )
+        self.invalidate_account_info()
 
     def get_channel_map(self, *, snap_name: str) -> channel_map.ChannelMap:
         """Return the channel map for snap_name."""
@@ -329,12 +345,28 @@ class LegacyStoreClientCLI:
     def get_account_info(
         self,
     ) -> dict[str, Any]:
-        """Return account information."""
-        return self.request(
+        """Return account information.
+
+        The response is cached for a short time: commands like close, status
+        and upload-metadata each fetch account information more than once per
+        invocation, and every fetch is a full HTTPS round trip.
+        """
+        if self._cached_account_info is not None:
+            timestamp, account_info = self._cached_account_info
+            if time.monotonic() - timestamp < _ACCOUNT_INFO_TTL:
+                return account_info
+
+        account_info = self.request(
             "GET",
             self._base_url + "/dev/api/account",
             headers={"Accept": "application/json"},
         ).json()
+        self._cached_account_info = (time.monotonic(), account_info)
+        return account_info
+
+    def invalidate_account_info(self) -> None:
+        """Drop cached account information, forcing the next call to fetch."""
+        self._cached_account_info = None
 
     def get_names(self) -> list[tuple[str, str, str, str]]:
         """Return a table with the registered names and status."""
@@ -18,6 +18,7 @@
 
 from __future__ import annotations
 
+import functools
 import multiprocessing
 import os
 import pathlib
@@ -44,6 +45,10 @@ if TYPE_CHECKING:
 
     from craft_parts import ProjectInfo
 
+# Prefer the libyaml-backed loader: manifest.yaml for a large snap can be
+# hundreds of kilobytes, where the C scanner is an order of magnitude faster.
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def get_supported_architectures() -> list[str]:
     """Get list of supported architectures for building."""
@@ -274,9 +279,14 @@ def get_ld_library_paths(prime_dir: Path, arch_triplet: str | None) -> str:
     return re.sub(str(prime_dir), "$SNAP", ld_library_path)
 
 
+@functools.cache
 def get_host_tool(command_name: str) -> str:
     """Return the full path of the given host tool.
 
+    Memoized: resolution walks PATH with a stat per candidate, and batch
+    operations (signing many snaps, linting) resolve the same tools over
+    and over.
+
     :param command_name: the name of the command to resolve a path for.
     :return: Path to command
 
@@ -291,12 +301,16 @@ def get_host_tool(command_name: str) -> str:
     return tool
 
 
+@functools.cache
 def get_snap_tool(command_name: str) -> str:
     """Return the path of a command found in the snap.
 
     If snapcraft is not running as a snap, shutil.which() is used
     to resolve the command using PATH.
 
+    Memoized like get_host_tool; the snap environment cannot change
+    within a process.
+
     :param command_name: the name of the command to resolve a path for.
     :return: Path to command
 
@@ -407,18 +421,64 @@ def unsquash_snap(snap_file: Path, extra_args: Sequence[str] = ()) -> Iterator[P
         ]
 
         try:
-            subprocess.run(extract_command, capture_output=True, check=True)
+            # the extraction listing on stdout is progress noise; discard it
+            # instead of buffering the whole thing in memory
+            subprocess.run(
+                extract_command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True,
+            )
         except subprocess.CalledProcessError as error:
+            details = None
+            if error.stderr:
+                details = error.stderr.decode(errors="replace").strip()
             raise errors.SnapcraftError(
-                f"could not unsquash snap file {snap_file.name!r}"
+                f"could not unsquash snap file {snap_file.name!r}", details=details
             ) from error
 
         yield Path(temp_dir)
 
 
+def get_file_from_snap_file(snap_path: Path, file_path: str) -> bytes | None:
+    """Read a single file out of a snap file without unsquashing it to disk.
+
+    :param snap_path: Path to the snap file.
+    :param file_path: Path of the file inside the snap.
+
+    :returns: The file's contents, or None if the file isn't in the snap.
+
+    :raises SnapcraftError: If the snap file cannot be read.
+    """
+    snap_path = snap_path.resolve()
+
+    # unsquashfs -cat streams the file to stdout, so nothing hits the disk
+    cat_command = ["unsquashfs", "-cat", str(snap_path), file_path]
+
+    result = subprocess.run(cat_command, capture_output=True, check=False)
+    if result.returncode == 0:
+        return result.stdout
+
+    # unsquashfs names the requested path when it isn't in the image; other
+    # failures (unreadable or corrupt snap) complain about the image itself
+    if file_path in result.stderr.decode(errors="replace"):
+        return None
+
+    raise errors.SnapcraftError(f"could not read snap file {snap_path.name!r}")
+
+
+# Parsed snap file metadata, keyed on (path, mtime, size) so a snap that is
+# rebuilt in place is re-read.
+_snap_data_cache: dict[tuple[str, int, int], tuple[dict, dict | None]] = {}
+
+
 def get_data_from_snap_file(snap_path: Path) -> tuple[dict, dict | None]:
     """Extract snap.yaml and manifest.yaml data from a snap file.
 
+    Results are cached per file: flows like upload with metadata inspect the
+    same .snap more than once, and each inspection costs an unsquashfs run
+    plus a YAML parse.
+
     :param snap_path: Path to the snap file.
 
     :returns: A tuple of (snap.yaml, manifest.yaml) where manifest.yaml may be None.
@@ -426,17 +486,30 @@ def get_data_from_snap_file(snap_path: Path) -> tuple[dict, dict | None]:
     :raises SnapcraftError: If the snap file cannot be read.
     :raises FileNotFoundError: If snap.yaml doesn't exist.
     """
-    with unsquash_snap(
-        snap_path, extra_args=["meta/snap.yaml", "snap/manifest.yaml"]
-    ) as snap_dir:
-        snap_yaml_path = snap_dir / "meta" / "snap.yaml"
-        with snap_yaml_path.open() as yaml_file:
-            snap_yaml = yaml.safe_load(yaml_file)
-
-        manifest_yaml: dict | None = None
-        manifest_path = snap_dir / "snap" / "manifest.yaml"
-        if manifest_path.exists():
-            with manifest_path.open() as manifest_yaml_file:
-                manifest_yaml = yaml.safe_load(manifest_yaml_file)
+    cache_key: tuple[str, int, int] | None = None
+    try:
+        snap_stat = snap_path.stat()
+        cache_key = (os.fspath(snap_path), snap_stat.st_mtime_ns, snap_stat.st_size)
+    except OSError:
+        # unreadable file; let unsquashfs report the error
+        pass
+
+    if cache_key is not None and cache_key in _snap_data_cache:
+        return _snap_data_cache[cache_key]
+
+    snap_yaml_bytes = get_file_from_snap_file(snap_path, "meta/snap.yaml")
+    if snap_yaml_bytes is None:
+        raise FileNotFoundError(
+            f"'meta/snap.yaml' not found in snap file {snap_path.name!r}"
+        )
+    snap_yaml = yaml.load(snap_yaml_bytes, Loader=_YamlSafeLoader)  # noqa: S506
+
+    manifest_yaml: dict | None = None
+    manifest_yaml_bytes = get_file_from_snap_file(snap_path, "snap/manifest.yaml")
+    if manifest_yaml_bytes is not None:
+        manifest_yaml = yaml.load(manifest_yaml_bytes, Loader=_YamlSafeLoader)  # noqa: S506
+
+    if cache_key is not None:
+        _snap_data_cache[cache_key] = (snap_yaml, manifest_yaml)
 
     return snap_yaml, manifest_yaml
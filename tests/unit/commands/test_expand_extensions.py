@@ -20,7 +20,6 @@ from pathlib import Path
 from textwrap import dedent
 
 import pytest
-from craft_platforms import DebianArchitecture
 
 from snapcraft import commands, const
 
@@ -81,33 +80,28 @@ def test_expand_extensions_simple_core22(new_dir, emitter, fake_app_config):
     cmd.run(Namespace())
     emitter.assert_message(
         dedent(
-            f"""\
+            """\
         name: test-name
         version: '0.1'
         summary: testing extensions
         description: expand a fake extension
         base: core22
-        parts:
-          part1:
-            plugin: nil
-            after:
-            - fake-extension/fake-part
-          fake-extension/fake-part:
-            plugin: nil
         confinement: strict
         grade: stable
-        architectures:
-        - build-on:
-          - {DebianArchitecture.from_host()}
-          build-for:
-          - {DebianArchitecture.from_host()}
         apps:
           app1:
             command: app1
-            plugs:
-            - fake-plug
             command-chain:
             - fake-command
+            plugs:
+            - fake-plug
+        parts:
+          part1:
+            plugin: nil
+            after:
+            - fake-extension/fake-part
+          fake-extension/fake-part:
+            plugin: nil
         """
         )
     )
@@ -154,22 +148,22 @@ def test_expand_extensions_simple(new_dir, emitter, valid_core_data, fake_app_co
         description: expand a fake extension
         base: {valid_core_data.base}
         build-base: {valid_core_data.build_base}
-        parts:
-          part1:
-            plugin: nil
-            after:
-            - fake-extension/fake-part
-          fake-extension/fake-part:
-            plugin: nil
         confinement: strict
         grade: {valid_core_data.grade}
         apps:
           app1:
             command: app1
-            plugs:
-            - fake-plug
             command-chain:
             - fake-command
+            plugs:
+            - fake-plug
+        parts:
+          part1:
+            plugin: nil
+            after:
+            - fake-extension/fake-part
+          fake-extension/fake-part:
+            plugin: nil
         """
         )
     )
@@ -183,7 +177,7 @@ def test_expand_extensions_complex_core22(new_dir, emitter, mocker, fake_app_con
     """
     # mock for advanced grammar parsing (i.e. `on amd64:`)
     mocker.patch(
-        "craft_platforms.DebianArchitecture.from_host",
+        "snapcraft.commands.extensions._host_arch_str",
         return_value="amd64",
     )
     with Path("snapcraft.yaml").open("w") as yaml_file:
@@ -224,12 +218,21 @@ def test_expand_extensions_complex_core22(new_dir, emitter, mocker, fake_app_con
     cmd.run(Namespace())
     emitter.assert_message(
         dedent(
-            f"""\
+            """\
             name: test-name
             version: '0.1'
             summary: testing extensions
             description: expand a fake extension
             base: core22
+            confinement: strict
+            grade: stable
+            apps:
+              app1:
+                command: app1
+                command-chain:
+                - fake-command
+                plugs:
+                - fake-plug
             parts:
               nil:
                 plugin: nil
@@ -241,20 +244,6 @@ def test_expand_extensions_complex_core22(new_dir, emitter, mocker, fake_app_con
                 - fake-extension/fake-part
               fake-extension/fake-part:
                 plugin: nil
-            confinement: strict
-            grade: stable
-            architectures:
-            - build-on:
-              - {DebianArchitecture.from_host()}
-              build-for:
-              - {DebianArchitecture.from_host()}
-            apps:
-              app1:
-                command: app1
-                plugs:
-                - fake-plug
-                command-chain:
-                - fake-command
         """
         )
     )
@@ -270,7 +259,7 @@ def test_expand_extensions_complex(
     """
     # mock for advanced grammar parsing (i.e. `on amd64:`)
     mocker.patch(
-        "craft_platforms.DebianArchitecture.from_host",
+        "snapcraft.commands.extensions._host_arch_str",
         return_value="amd64",
     )
     with Path("snapcraft.yaml").open("w") as yaml_file:
@@ -319,6 +308,15 @@ def test_expand_extensions_complex(
             description: expand a fake extension
             base: {valid_core_data.base}
             build-base: {valid_core_data.build_base}
+            confinement: strict
+            grade: {valid_core_data.grade}
+            apps:
+              app1:
+                command: app1
+                command-chain:
+                - fake-command
+                plugs:
+                - fake-plug
             parts:
               nil:
                 plugin: nil
@@ -330,15 +328,75 @@ def test_expand_extensions_complex(
                 - fake-extension/fake-part
               fake-extension/fake-part:
                 plugin: nil
+        """
+        )
+    )
+
+
+@pytest.mark.usefixtures("fake_extension")
+def test_expand_extensions_validate(new_dir, emitter, mocker, fake_app_config):
+    """Expand and validate an extension, emitting the model's yaml."""
+    mocker.patch(
+        "snapcraft.commands.extensions._host_arch_str",
+        return_value="amd64",
+    )
+    with Path("snapcraft.yaml").open("w") as yaml_file:
+        print(
+            dedent(
+                """\
+            name: test-name
+            version: "0.1"
+            summary: testing extensions
+            description: expand a fake extension
+            base: core22
             confinement: strict
-            grade: {valid_core_data.grade}
+            grade: stable
+
             apps:
-              app1:
-                command: app1
-                plugs:
-                - fake-plug
-                command-chain:
-                - fake-command
+                app1:
+                    command: app1
+                    command-chain: [fake-command]
+                    extensions: [fake-extension]
+
+            parts:
+                part1:
+                    plugin: nil
+            """
+            ),
+            file=yaml_file,
+        )
+
+    cmd = commands.ExpandExtensionsCommand(fake_app_config)
+    cmd.run(Namespace(validate=True))
+    emitter.assert_message(
+        dedent(
+            """\
+        name: test-name
+        version: '0.1'
+        summary: testing extensions
+        description: expand a fake extension
+        base: core22
+        parts:
+          part1:
+            plugin: nil
+            after:
+            - fake-extension/fake-part
+          fake-extension/fake-part:
+            plugin: nil
+        confinement: strict
+        grade: stable
+        architectures:
+        - build-on:
+          - amd64
+          build-for:
+          - amd64
+        apps:
+          app1:
+            command: app1
+            plugs:
+            - fake-plug
+            command-chain:
+            - fake-command
         """
         )
     )
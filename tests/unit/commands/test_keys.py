@@ -44,6 +44,14 @@ _TEST_KEY_1 = {"name": "test-key-1", "sha3-384": "abc123"}
 _TEST_KEY_2 = {"name": "test-key-2", "sha3-384": "deadbeef"}
 
 
+@pytest.fixture(autouse=True)
+def clear_keys_cache():
+    """Key listings are memoized; don't let them leak between tests."""
+    keys._load_keys.cache_clear()
+    yield
+    keys._load_keys.cache_clear()
+
+
 @pytest.fixture
 def mock_subprocess_check_call(mocker):
     return mocker.patch("subprocess.check_call")
@@ -130,6 +138,23 @@ class TestGetUsableKeys:
 
         assert keys == []
 
+    def test_get_usable_keys_cached(self, mocker):
+        mock_output = mocker.patch(
+            "subprocess.check_output",
+            return_value=json.dumps(
+                [
+                    _TEST_KEY_1,
+                    _TEST_KEY_2,
+                ]
+            ),
+        )
+
+        list(_get_usable_keys())
+        filtered = list(_get_usable_keys(name="test-key-1"))
+
+        assert filtered == [_TEST_KEY_1]
+        assert mock_output.call_count == 1
+
     def test_get_usable_keys_snapd_error(self, mocker):
         mocker.patch(
             "subprocess.check_output",
@@ -247,6 +272,21 @@ class TestCreateKeyCommand:
             call(["snap", "create-key", "test-key-1"])
         ]
 
+    @pytest.mark.usefixtures("fake_store_client")
+    def test_create_key_invalidates_key_cache(
+        self, mocker, mock_subprocess_check_call, fake_app_config
+    ):
+        """The cached key listing is stale once a new key is created."""
+        mock_output = mocker.patch(
+            "subprocess.check_output", return_value=json.dumps(None)
+        )
+        cmd = commands.StoreCreateKeyCommand(fake_app_config)
+
+        cmd.run(argparse.Namespace(key_name="test-key-1"))
+        list(_get_usable_keys())
+
+        assert mock_output.call_count == 2
+
     def test_create_key_already_exists(
         self,
         mock_subprocess_check_call,
@@ -352,7 +392,7 @@ class TestRegisterKeyCommand:
     ):
         monkeypatch.setenv(store.constants.ENVIRONMENT_STORE_CREDENTIALS, "creds")
         fake_get_usable_keys.return_value = [_TEST_KEY_1]
-        mock_subprocess_check_output.return_value = "test-serialized-assertion"
+        mock_subprocess_check_output.return_value = b"test-serialized-assertion"
         cmd = commands.StoreRegisterKeyCommand(fake_app_config)
 
         cmd.run(argparse.Namespace(key_name="test-key-1"))
@@ -362,10 +402,7 @@ class TestRegisterKeyCommand:
             ttl=86400,
         )
         assert mock_subprocess_check_output.mock_calls == [
-            call(
-                ["snap", "export-key", "--account=test-account-id", "test-key-1"],
-                universal_newlines=True,
-            )
+            call(["snap", "export-key", "--account=test-account-id", "test-key-1"])
         ]
         fake_store_client.register_key.assert_called_once_with(
             "test-serialized-assertion"
@@ -428,17 +465,14 @@ class TestRegisterKeyCommand:
         emitter,
     ):
         fake_get_usable_keys.return_value = [_TEST_KEY_1, _TEST_KEY_2]
-        mock_subprocess_check_output.return_value = "test-serialized-assertion"
+        mock_subprocess_check_output.return_value = b"test-serialized-assertion"
         mocker.patch("craft_cli.emit.prompt", return_value=selection)
         cmd = commands.StoreRegisterKeyCommand(fake_app_config)
 
         cmd.run(argparse.Namespace(key_name=None))
 
         assert mock_subprocess_check_output.mock_calls == [
-            call(
-                ["snap", "export-key", "--account=test-account-id", key_name],
-                universal_newlines=True,
-            )
+            call(["snap", "export-key", "--account=test-account-id", key_name])
         ]
         fake_store_client.register_key.assert_called_once_with(
             "test-serialized-assertion"
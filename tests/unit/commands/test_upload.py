@@ -1,5 +1,4 @@
 import argparse
-import contextlib
 import pathlib
 import re
 import sys
@@ -83,25 +82,18 @@ def fake_get_data_from_snap_file(mocker):
 
 
 @pytest.fixture
-def fake_unsquash_no_icon(mocker, tmp_path):
-    @contextlib.contextmanager
-    def _fake(snap_path, extra_args=()):
-        (tmp_path / "meta" / "gui").mkdir(parents=True, exist_ok=True)
-        yield tmp_path
-
-    return mocker.patch("snapcraft.utils.unsquash_snap", new=_fake)
+def fake_unsquash_no_icon(mocker):
+    return mocker.patch("snapcraft.utils.get_file_from_snap_file", return_value=None)
 
 
 @pytest.fixture
-def fake_unsquash_with_icon(mocker, tmp_path):
-    @contextlib.contextmanager
-    def _fake(snap_path, extra_args=()):
-        icon_dir = tmp_path / "meta" / "gui"
-        icon_dir.mkdir(parents=True, exist_ok=True)
-        (icon_dir / "icon.png").write_bytes(b"fake-icon-content")
-        yield tmp_path
+def fake_unsquash_with_icon(mocker):
+    def _fake(snap_path, file_path):
+        if file_path == "meta/gui/icon.png":
+            return b"fake-icon-content"
+        return None
 
-    return mocker.patch("snapcraft.utils.unsquash_snap", new=_fake)
+    return mocker.patch("snapcraft.utils.get_file_from_snap_file", side_effect=_fake)
 
 
 @pytest.fixture
@@ -491,7 +483,6 @@ def test_upload_metadata_with_icon(
     fake_store_upload_binary_metadata,
     snap_file,
     fake_app_config,
-    tmp_path,
 ):
     """Upload an icon from the snap."""
     cmd = commands.StoreUploadMetadataCommand(fake_app_config)
@@ -507,7 +498,7 @@ def test_upload_metadata_with_icon(
     ]
     icon = fake_store_upload_binary_metadata.mock_calls[0].kwargs["metadata"]["icon"]
     assert icon is not None
-    assert icon.name == str(tmp_path / "meta" / "gui" / "icon.png")
+    assert icon.name == "meta/gui/icon.png"
 
 
 def test_upload_metadata_invalid_file(fake_app_config):
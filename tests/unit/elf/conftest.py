@@ -20,6 +20,7 @@ from pathlib import Path
 
 import pytest
 
+from snapcraft import utils
 from snapcraft.elf import ElfFile, _elf_file
 from tests import TESTS_DIR
 
@@ -92,6 +93,13 @@ def fake_tools(new_dir, monkeypatch):
 
     monkeypatch.setenv("PATH", f"{bin_path!s}:{os.getenv('PATH')}")
 
+    # Tool path lookups are memoized; don't let the per-test PATH leak
+    utils.get_host_tool.cache_clear()
+    utils.get_snap_tool.cache_clear()
+    yield
+    utils.get_host_tool.cache_clear()
+    utils.get_snap_tool.cache_clear()
+
 
 def _fake_elffile_extract_attributes(  # noqa: PLR0915
     self,
@@ -15,9 +15,14 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import datetime
+
 import pytest
 
-from snapcraft.extensions._utils import _apply_extension_property
+from snapcraft.extensions._utils import (
+    _apply_extension_property,
+    _deep_copy_yaml_data,
+)
 
 
 @pytest.mark.parametrize(
@@ -80,3 +85,23 @@ def test_apply_property_dictionary(
         _apply_extension_property(existing_property, extension_property)
         == expected_value
     )
+
+
+@pytest.mark.parametrize(
+    "yaml_data",
+    [
+        # plain data takes the json round-trip
+        {"apps": {"app1": {"command": "app1"}}, "grade": "stable"},
+        # non-string keys (YAML 1.1 'on:'/'123:') must not be coerced
+        {True: "v1", 2: "v2", "apps": {123: {"command": "app1"}}},
+        # non-string keys nested in lists
+        {"parts": [{True: "v1"}]},
+        # non-json types fall back to deepcopy
+        {"build-date": datetime.datetime(2024, 1, 1)},
+    ],
+)
+def test_deep_copy_yaml_data(yaml_data):
+    copied = _deep_copy_yaml_data(yaml_data)
+
+    assert copied == yaml_data
+    assert copied is not yaml_data
@@ -16,6 +16,7 @@
 
 """Tests for the abstract assertions service."""
 
+import io
 import json
 import tempfile
 import textwrap
@@ -71,12 +72,34 @@ def write_text(mocker, tmp_path, request):
 
 @pytest.fixture
 def fake_sign_assertion(mocker):
-    def _fake_sign(cmdline, input):  # noqa: A002 (builtin-argument-shadowing)
-        return input + b"-signed"
+    """Fake 'snap sign' by appending '-signed' to the piped-in assertion."""
 
-    mock_subprocess = mocker.patch("subprocess.check_output")
-    mock_subprocess.side_effect = _fake_sign
-    return mock_subprocess
+    class _FakeStdin(io.BytesIO):
+        """Capture the piped-in bytes, surviving close()."""
+
+        def __init__(self):
+            super().__init__()
+            self.captured = b""
+
+        def close(self):
+            self.captured = self.getvalue()
+            super().close()
+
+    class _FakeSignProcess:
+        def __init__(self, cmdline, stdin=None, stdout=None):
+            self.args = cmdline
+            self.returncode = 0
+            self.stdin = _FakeStdin()
+            self.stdout = mocker.Mock()
+            self.stdout.read.side_effect = lambda: self.stdin.captured + b"-signed"
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+    return mocker.patch("subprocess.Popen", side_effect=_FakeSignProcess)
 
 
 @pytest.fixture(autouse=True)
@@ -354,6 +377,37 @@ def test_edit_assertions_build_assertion_error(
     assert not (tmp_path / "assertion-file").exists()
 
 
+def test_sign_assertion_broken_pipe(mocker, fake_assertion_service, emitter):
+    """Report the friendly error when 'snap sign' exits before draining stdin."""
+
+    class _BrokenStdin(io.BytesIO):
+        def write(self, data):
+            raise BrokenPipeError
+
+    class _FakeFailedProcess:
+        def __init__(self, cmdline, stdin=None, stdout=None):
+            self.args = cmdline
+            self.returncode = 1
+            self.stdin = _BrokenStdin()
+            self.stdout = mocker.Mock()
+            self.stdout.read.return_value = b""
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+    mocker.patch("subprocess.Popen", side_effect=_FakeFailedProcess)
+
+    with pytest.raises(
+        errors.SnapcraftAssertionError, match="Failed to sign assertion"
+    ):
+        fake_assertion_service.sign_assertion(
+            FakeAssertion(test_field_1="test-value-1", test_field_2=0), key_name=None
+        )
+
+
 @pytest.mark.parametrize(
     "write_text",
     [
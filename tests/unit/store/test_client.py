@@ -856,6 +856,40 @@ def test_get_account_info(fake_client):
     ]
 
 
+def test_get_account_info_cached(fake_client):
+    """Repeat calls on the same client reuse the cached response."""
+    store_client = client.StoreClientCLI()
+
+    store_client.get_account_info()
+    store_client.get_account_info()
+
+    assert fake_client.request.call_count == 1
+
+
+def test_get_account_info_cache_expires(fake_client, mocker):
+    """A stale cache entry is refreshed from the store."""
+    mocker.patch(
+        "snapcraft.store.client.time.monotonic", side_effect=[0.0, 1000.0, 1000.0]
+    )
+    store_client = client.StoreClientCLI()
+
+    store_client.get_account_info()
+    store_client.get_account_info()
+
+    assert fake_client.request.call_count == 2
+
+
+def test_get_account_info_invalidate(fake_client):
+    """Invalidation forces the next call to fetch from the store."""
+    store_client = client.StoreClientCLI()
+
+    store_client.get_account_info()
+    store_client.invalidate_account_info()
+    store_client.get_account_info()
+
+    assert fake_client.request.call_count == 2
+
+
 #########
 # Names #
 #########
@@ -14,191 +14,128 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from unittest.mock import call
-
 import pytest
 
 from snapcraft import errors, pack
 
 
-def test_pack_snap(mocker, new_dir):
-    mock_run = mocker.patch("subprocess.run")
-    pack.pack_snap(new_dir, output=None)
-    assert mock_run.mock_calls[:2] == [
-        call(
-            ["snap", "pack", "--check-skeleton", new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-        call(
-            ["snap", "pack", new_dir, new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-    ]
-
-
-def test_pack_snap_compression_none(mocker, new_dir):
+def test_pack_snap(fake_process, new_dir):
+    fake_process.register_subprocess(
+        ["snap", "pack", str(new_dir), str(new_dir)],
+        stdout=b"built: hello_1.0_amd64.snap",
+    )
+
+    name = pack.pack_snap(new_dir, output=None)
+
+    assert name == "hello_1.0_amd64.snap"
+
+
+def test_pack_snap_compression_none(fake_process, new_dir):
     """No compression uses snap default."""
-    mock_run = mocker.patch("subprocess.run")
-    pack.pack_snap(new_dir, output=None, compression=None)
-    assert mock_run.mock_calls[:2] == [
-        call(
-            ["snap", "pack", "--check-skeleton", new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-        call(
-            ["snap", "pack", new_dir, new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-    ]
-
-
-def test_pack_snap_compression(mocker, new_dir):
+    fake_process.register_subprocess(
+        ["snap", "pack", str(new_dir), str(new_dir)],
+        stdout=b"built: hello_1.0_amd64.snap",
+    )
+
+    name = pack.pack_snap(new_dir, output=None, compression=None)
+
+    assert name == "hello_1.0_amd64.snap"
+
+
+def test_pack_snap_compression(fake_process, new_dir):
     """Compression should be passed to snap pack."""
-    mock_run = mocker.patch("subprocess.run")
-    pack.pack_snap(new_dir, output=None, compression="zz")
-    assert mock_run.mock_calls[:2] == [
-        call(
-            ["snap", "pack", "--check-skeleton", new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-        call(
-            ["snap", "pack", "--compression", "zz", new_dir, new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-    ]
-
-
-def test_pack_snap_output_file_output_directory_cwd(mocker, new_dir):
+    fake_process.register_subprocess(
+        ["snap", "pack", "--compression", "zz", str(new_dir), str(new_dir)],
+        stdout=b"built: hello_1.0_amd64.snap",
+    )
+
+    name = pack.pack_snap(new_dir, output=None, compression="zz")
+
+    assert name == "hello_1.0_amd64.snap"
+
+
+def test_pack_snap_output_file_output_directory_cwd(fake_process, new_dir):
     """Output to a filename in the current working directory."""
-    mock_run = mocker.patch("subprocess.run")
-    pack.pack_snap(new_dir, output=f"{new_dir}/test.snap")
-    assert mock_run.mock_calls[:2] == [
-        call(
-            ["snap", "pack", "--check-skeleton", new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-        call(
-            ["snap", "pack", "--filename", "test.snap", new_dir, new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-    ]
-
-
-def test_pack_snap_output_file_output_directory_existing(mocker, new_dir):
+    fake_process.register_subprocess(
+        ["snap", "pack", "--filename", "test.snap", str(new_dir), str(new_dir)],
+        stdout=b"built: test.snap",
+    )
+
+    name = pack.pack_snap(new_dir, output=f"{new_dir}/test.snap")
+
+    assert name == "test.snap"
+
+
+def test_pack_snap_output_file_output_directory_existing(fake_process, new_dir):
     """Output to an existing directory."""
-    mock_run = mocker.patch("subprocess.run")
     output_directory = new_dir / "output"
     output_directory.mkdir()
     assert output_directory.is_dir()
+    fake_process.register_subprocess(
+        [
+            "snap",
+            "pack",
+            "--filename",
+            "test.snap",
+            str(new_dir),
+            str(output_directory),
+        ],
+        stdout=b"built: test.snap",
+    )
+
+    name = pack.pack_snap(new_dir, output=output_directory / "test.snap")
+
+    assert name == "test.snap"
 
-    pack.pack_snap(new_dir, output=output_directory / "test.snap")
-
-    assert mock_run.mock_calls[:2] == [
-        call(
-            ["snap", "pack", "--check-skeleton", new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-        call(
-            ["snap", "pack", "--filename", "test.snap", new_dir, output_directory],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-    ]
-
-
-def test_pack_snap_output_file_output_directory_non_existant(mocker, new_dir):
+
+def test_pack_snap_output_file_output_directory_non_existant(fake_process, new_dir):
     """Output to a non-existent directory."""
-    mock_run = mocker.patch("subprocess.run")
     output_directory = new_dir / "output"
     assert not output_directory.exists()
+    fake_process.register_subprocess(
+        [
+            "snap",
+            "pack",
+            "--filename",
+            "test.snap",
+            str(new_dir),
+            str(new_dir / "output"),
+        ],
+        stdout=b"built: test.snap",
+    )
+
+    name = pack.pack_snap(new_dir, output=output_directory / "test.snap")
+
+    assert name == "test.snap"
 
-    pack.pack_snap(new_dir, output=output_directory / "test.snap")
-
-    assert mock_run.mock_calls[:2] == [
-        call(
-            ["snap", "pack", "--check-skeleton", new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-        call(
-            [
-                "snap",
-                "pack",
-                "--filename",
-                "test.snap",
-                new_dir,
-                (new_dir / "output"),
-            ],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-    ]
-
-
-def test_pack_snap_output_directory_cwd_no_filename(mocker, new_dir):
+
+def test_pack_snap_output_directory_cwd_no_filename(fake_process, new_dir):
     """Output to the current working directory when no filename is specified."""
-    mock_run = mocker.patch("subprocess.run")
-    pack.pack_snap(new_dir, output=str(new_dir))
-    assert mock_run.mock_calls[:2] == [
-        call(
-            ["snap", "pack", "--check-skeleton", new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-        call(
-            ["snap", "pack", new_dir, new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-    ]
-
-
-def test_pack_snap_output_file_output_directory_existing_no_filename(mocker, new_dir):
+    fake_process.register_subprocess(
+        ["snap", "pack", str(new_dir), str(new_dir)],
+        stdout=b"built: hello_1.0_amd64.snap",
+    )
+
+    name = pack.pack_snap(new_dir, output=str(new_dir))
+
+    assert name == "hello_1.0_amd64.snap"
+
+
+def test_pack_snap_output_file_output_directory_existing_no_filename(
+    fake_process, new_dir
+):
     """Outputs to an existing directory when no filename is specified."""
-    mock_run = mocker.patch("subprocess.run")
     output_directory = new_dir / "output"
     output_directory.mkdir()
     assert output_directory.is_dir()
+    fake_process.register_subprocess(
+        ["snap", "pack", str(new_dir), str(output_directory)],
+        stdout=b"built: hello_1.0_amd64.snap",
+    )
 
-    pack.pack_snap(new_dir, output=output_directory)
+    name = pack.pack_snap(new_dir, output=output_directory)
 
-    assert mock_run.mock_calls[:2] == [
-        call(
-            ["snap", "pack", "--check-skeleton", new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-        call(
-            ["snap", "pack", new_dir, output_directory],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-    ]
+    assert name == "hello_1.0_amd64.snap"
 
 
 @pytest.mark.parametrize(
@@ -209,80 +146,68 @@ def test_pack_snap_output_file_output_directory_existing_no_filename(mocker, new
         {"version": "1.0", "target": "armhf"},
     ],
 )
-def test_pack_snap_file_name_missing_parameters(mocker, new_dir, parameters):
+def test_pack_snap_file_name_missing_parameters(fake_process, new_dir, parameters):
     """If name, version, and target are not all specified, then use
     snap's default naming convention."""
-    mock_run = mocker.patch("subprocess.run")
-    pack.pack_snap(new_dir, output=None, **parameters)
-    assert mock_run.mock_calls[:2] == [
-        call(
-            ["snap", "pack", "--check-skeleton", new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-        call(
-            ["snap", "pack", new_dir, new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-    ]
-
-
-def test_pack_snap_file_name_valid(mocker, new_dir):
+    fake_process.register_subprocess(
+        ["snap", "pack", str(new_dir), str(new_dir)],
+        stdout=b"built: hello_1.0_amd64.snap",
+    )
+
+    name = pack.pack_snap(new_dir, output=None, **parameters)
+
+    assert name == "hello_1.0_amd64.snap"
+
+
+def test_pack_snap_file_name_valid(fake_process, new_dir):
     """Passing name, version, and target should produce a valid file name."""
-    mock_run = mocker.patch("subprocess.run")
-    pack.pack_snap(
+    fake_process.register_subprocess(
+        [
+            "snap",
+            "pack",
+            "--filename",
+            "hello_1.0_armhf.snap",
+            str(new_dir),
+            str(new_dir),
+        ],
+        stdout=b"built: hello_1.0_armhf.snap",
+    )
+
+    name = pack.pack_snap(
         new_dir,
         output=None,
         name="hello",
         version="1.0",
         target="armhf",
     )
-    assert mock_run.mock_calls[:2] == [
-        call(
-            ["snap", "pack", "--check-skeleton", new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-        call(
-            ["snap", "pack", "--filename", "hello_1.0_armhf.snap", new_dir, new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-    ]
-
-
-def test_pack_snap_use_output_name_over_name_version_arch(mocker, new_dir):
+
+    assert name == "hello_1.0_armhf.snap"
+
+
+def test_pack_snap_use_output_name_over_name_version_arch(fake_process, new_dir):
     """Output filename takes priority over name, version, and target parameters."""
-    mock_run = mocker.patch("subprocess.run")
-    pack.pack_snap(
+    fake_process.register_subprocess(
+        ["snap", "pack", "--filename", "test.snap", str(new_dir), str(new_dir)],
+        stdout=b"built: test.snap",
+    )
+
+    name = pack.pack_snap(
         new_dir,
         output="test.snap",
         name="hello",
         version="1.0",
         target="armhf",
     )
-    assert mock_run.mock_calls[:2] == [
-        call(
-            ["snap", "pack", "--check-skeleton", new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-        call(
-            ["snap", "pack", "--filename", "test.snap", new_dir, new_dir],
-            capture_output=True,
-            check=True,
-            text=True,
-        ),
-    ]
+
+    assert name == "test.snap"
 
 
 def test_pack_snap_error(mocker, new_dir, fake_process):
+    fake_process.register_subprocess(
+        ["snap", "pack", str(new_dir), str(new_dir)],
+        stderr=b"error: cannot pack",
+        returncode=1,
+    )
     fake_process.register_subprocess(
         ["snap", "pack", "--check-skeleton", str(new_dir)],
         stdout=b"xxxx",
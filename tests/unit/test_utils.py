@@ -15,7 +15,6 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
-from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import call, patch
 
@@ -203,6 +202,13 @@ def test_get_ld_library_paths_no_architecture(tmp_path, lib_dirs, expected_env):
 #################
 
 
+@pytest.fixture(autouse=True)
+def clear_tool_path_caches():
+    """Tool path lookups are memoized; don't leak them between tests."""
+    utils.get_host_tool.cache_clear()
+    utils.get_snap_tool.cache_clear()
+
+
 def test_get_host_tool_finds_command(mocker):
     mocker.patch("shutil.which", return_value="/usr/bin/foo")
 
@@ -504,6 +510,52 @@ class TestUnsquashSnap:
             assert unsquashed_snap.is_dir()
 
 
+class TestGetFileFromSnapFile:
+    """Tests for get_file_from_snap_file()."""
+
+    @pytest.fixture
+    def fake_snap_file(self, tmp_path):
+        snap_file = tmp_path / "test-snap.snap"
+        snap_file.touch()
+        return snap_file
+
+    def test_get_file(self, fake_process, fake_snap_file):
+        """Stream a file out of the snap with `unsquashfs -cat`."""
+        fake_process.register_subprocess(
+            ["unsquashfs", "-cat", str(fake_snap_file), "meta/gui/icon.png"],
+            stdout=b"fake-icon-content",
+        )
+
+        data = utils.get_file_from_snap_file(fake_snap_file, "meta/gui/icon.png")
+
+        assert data == b"fake-icon-content"
+
+    def test_get_file_missing(self, fake_process, fake_snap_file):
+        """Return None when the file isn't in the snap."""
+        fake_process.register_subprocess(
+            ["unsquashfs", "-cat", str(fake_snap_file), "meta/gui/icon.png"],
+            returncode=1,
+            stderr=b"cat: file meta/gui/icon.png not found\n",
+        )
+
+        data = utils.get_file_from_snap_file(fake_snap_file, "meta/gui/icon.png")
+
+        assert data is None
+
+    def test_get_file_error(self, fake_process, fake_snap_file):
+        """Error when the snap file itself can't be read."""
+        fake_process.register_subprocess(
+            ["unsquashfs", "-cat", str(fake_snap_file), "meta/gui/icon.png"],
+            returncode=1,
+            stderr=b"Can't find a SQUASHFS superblock on test-snap.snap\n",
+        )
+
+        with pytest.raises(errors.SnapcraftError) as raised:
+            utils.get_file_from_snap_file(fake_snap_file, "meta/gui/icon.png")
+
+        assert f"could not read snap file {fake_snap_file.name!r}" in str(raised.value)
+
+
 class TestGetDataFromSnapFile:
     """Tests for get_data_from_snap_file()."""
 
@@ -514,76 +566,104 @@ class TestGetDataFromSnapFile:
     }
     MANIFEST_YAML_CONTENT = {"snapcraft-started-at": "2026-01-01T00:00:00Z"}
 
-    @pytest.fixture
-    def snap_dir(self, tmp_path):
-        """A directory mimicking the contents of an unsquashed snap."""
-        (tmp_path / "meta").mkdir()
-        (tmp_path / "snap").mkdir()
-        return tmp_path
-
     @pytest.fixture
     def fake_snap_file(self, tmp_path):
         snap_file = tmp_path / "test-snap.snap"
         snap_file.touch()
         return snap_file
 
-    @pytest.fixture
-    def mock_unsquash(self, mocker, snap_dir):
-        """Mock unsquash_snap to yield snap_dir."""
-
-        @contextmanager
-        def _fake_unsquash(snap_file, extra_args=()):
-            yield snap_dir
-
-        return mocker.patch("snapcraft.utils.unsquash_snap", side_effect=_fake_unsquash)
+    @staticmethod
+    def _register_cat(fake_process, snap_file, file_path, **kwargs):
+        fake_process.register_subprocess(
+            ["unsquashfs", "-cat", str(snap_file), file_path], **kwargs
+        )
 
-    def test_snap_yaml(self, mock_unsquash, snap_dir, fake_snap_file):
+    def test_snap_yaml(self, fake_process, fake_snap_file):
         """Return snap.yaml."""
-        (snap_dir / "meta" / "snap.yaml").write_text(
-            yaml.dump(self.SNAP_YAML_CONTENT), encoding="utf-8"
+        self._register_cat(
+            fake_process,
+            fake_snap_file,
+            "meta/snap.yaml",
+            stdout=yaml.dump(self.SNAP_YAML_CONTENT).encode(),
+        )
+        self._register_cat(
+            fake_process,
+            fake_snap_file,
+            "snap/manifest.yaml",
+            returncode=1,
+            stderr=b"cat: file snap/manifest.yaml not found\n",
         )
 
         snap_yaml, manifest_yaml = utils.get_data_from_snap_file(fake_snap_file)
 
-        mock_unsquash.assert_called_once_with(
-            fake_snap_file,
-            extra_args=["meta/snap.yaml", "snap/manifest.yaml"],
-        )
         assert snap_yaml == self.SNAP_YAML_CONTENT
         assert manifest_yaml is None
 
-    def test_snap_and_manifest_yaml(self, mock_unsquash, snap_dir, fake_snap_file):
+    def test_snap_and_manifest_yaml(self, fake_process, fake_snap_file):
         """Return snap.yaml and manifest.yaml."""
-        (snap_dir / "meta" / "snap.yaml").write_text(
-            yaml.dump(self.SNAP_YAML_CONTENT), encoding="utf-8"
+        self._register_cat(
+            fake_process,
+            fake_snap_file,
+            "meta/snap.yaml",
+            stdout=yaml.dump(self.SNAP_YAML_CONTENT).encode(),
         )
-        (snap_dir / "snap" / "manifest.yaml").write_text(
-            yaml.dump(self.MANIFEST_YAML_CONTENT), encoding="utf-8"
+        self._register_cat(
+            fake_process,
+            fake_snap_file,
+            "snap/manifest.yaml",
+            stdout=yaml.dump(self.MANIFEST_YAML_CONTENT).encode(),
         )
 
         snap_yaml, manifest_yaml = utils.get_data_from_snap_file(fake_snap_file)
 
-        mock_unsquash.assert_called_once_with(
-            fake_snap_file,
-            extra_args=["meta/snap.yaml", "snap/manifest.yaml"],
-        )
         assert snap_yaml == self.SNAP_YAML_CONTENT
         assert manifest_yaml == self.MANIFEST_YAML_CONTENT
 
-    def test_snap_yaml_missing(self, mock_unsquash, snap_dir, fake_snap_file):
+    def test_cached_per_file(self, fake_process, fake_snap_file):
+        """A second read of an unchanged snap file reuses the parsed data."""
+        # each fake subprocess is registered (and consumable) only once, so a
+        # second read can only succeed if it comes from the cache
+        self._register_cat(
+            fake_process,
+            fake_snap_file,
+            "meta/snap.yaml",
+            stdout=yaml.dump(self.SNAP_YAML_CONTENT).encode(),
+        )
+        self._register_cat(
+            fake_process,
+            fake_snap_file,
+            "snap/manifest.yaml",
+            returncode=1,
+            stderr=b"cat: file snap/manifest.yaml not found\n",
+        )
+
+        first = utils.get_data_from_snap_file(fake_snap_file)
+        second = utils.get_data_from_snap_file(fake_snap_file)
+
+        assert second == first
+
+    def test_snap_yaml_missing(self, fake_process, fake_snap_file):
         """Error if the snap is missing a snap.yaml file."""
+        self._register_cat(
+            fake_process,
+            fake_snap_file,
+            "meta/snap.yaml",
+            returncode=1,
+            stderr=b"cat: file meta/snap.yaml not found\n",
+        )
+
         with pytest.raises(FileNotFoundError):
             utils.get_data_from_snap_file(fake_snap_file)
 
-    def test_error_on_unsquash_failure(self, mocker, fake_snap_file):
+    def test_error_on_unsquash_failure(self, fake_process, fake_snap_file):
         """Error when unsquashfs fails."""
+        self._register_cat(
+            fake_process,
+            fake_snap_file,
+            "meta/snap.yaml",
+            returncode=1,
+            stderr=b"Can't find a SQUASHFS superblock on test-snap.snap\n",
+        )
 
-        @contextmanager
-        def _failing_unsquash(snap_file, extra_args=()):
-            raise errors.SnapcraftError("test error")
-            yield
-
-        mocker.patch("snapcraft.utils.unsquash_snap", side_effect=_failing_unsquash)
-
-        with pytest.raises(errors.SnapcraftError, match="test error"):
+        with pytest.raises(errors.SnapcraftError, match="could not read snap file"):
             utils.get_data_from_snap_file(fake_snap_file)